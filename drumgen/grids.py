@@ -1,30 +1,374 @@
 #!/usr/bin/env python
 from array import array
+from os import urandom
 import random
 
+from .resources_drum_map import drum_map as _DRUM_MAP_RAW
+from .resources_euclidean import euclidean_rows as _EUCLIDEAN_ROWS
+
+try:
+    import micropython
+    from micropython import const
+except ImportError:
+    # Not on MicroPython, so the code emitter decorators are no-ops and the
+    # viper pointer casts just hand back the buffer
+    def const(value):
+        return value
+
+    class micropython:
+        @staticmethod
+        def native(f):
+            return f
+
+        viper = native
+
+    def ptr8(buf):
+        return buf
+
+    ptr32 = ptr8
+
+
+# Strides into the packed drum map, see _pack_drum_map
+_MAP_ROW_STRIDE = const(4)  # Cell (i + 1, j) is this far from cell (i, j)
+_MAP_STEP_STRIDE = const(16)  # One 4x4 grid of cells per instrument and step
+_MAP_INSTRUMENT_STRIDE = const(32 * 16)  # 32 steps per instrument
+
+
+@micropython.viper
+def _pack_drum_map(drum_map, packed):
+    # The 5x5 grid of nodes gives 4x4 cells to blend across. For each
+    # instrument and step, the four nodes around cell (i, j) are packed into
+    # one word at (((instrument * 32) + step) * _MAP_STEP_STRIDE) +
+    # (i * _MAP_ROW_STRIDE) + j: node (i, j) in the low byte, then (i + 1, j),
+    # (i, j + 1) and (i + 1, j + 1). A blend then needs a single load, and
+    # done in viper the top byte never makes a bignum on MicroPython
+    out = ptr32(packed)
+    for i in range(4):
+        for j in range(4):
+            a = ptr8(drum_map[i][j])
+            b = ptr8(drum_map[i + 1][j])
+            c = ptr8(drum_map[i][j + 1])
+            d = ptr8(drum_map[i + 1][j + 1])
+            k = (i * _MAP_ROW_STRIDE) + j
+            for offset in range(96):
+                out[k] = (
+                    a[offset] | (b[offset] << 8) | (c[offset] << 16) | (d[offset] << 24)
+                )
+                k += _MAP_STEP_STRIDE
+
+
+# Only the first row of the Euclidean table is used, its 8 patterns picked
+# by each channel's density
+_EUCLIDEAN_ROW0 = _EUCLIDEAN_ROWS[:8]
+
+# Built once at import and shared by every PatternGenerator
+_DRUM_MAP = array("I", [0] * (96 * _MAP_STEP_STRIDE))
+_pack_drum_map(_DRUM_MAP_RAW, _DRUM_MAP)
+
+
+# Where (x, y) falls on the map, as offsets into a mix buffer: its cell,
+# then the x and y balances and their complements
+_MIX_CELL = const(0)
+_MIX_X_BALANCE = const(1)
+_MIX_Y_BALANCE = const(2)
+_MIX_X_REST = const(3)
+_MIX_Y_REST = const(4)
+
+
+def _compute_mix(x, y, mix):
+    # The drum map is read with unchecked pointers, so x and y are clamped
+    # to 0..255 first. Past 255 they would pick a cell off the map
+    x = min(max(x, 0), 255)
+    y = min(max(y, 0), 255)
+    mix[_MIX_CELL] = ((x >> 6) * _MAP_ROW_STRIDE) + (y >> 6)
+
+    # Blend in 16 steps across each cell, 0 to 255 in steps of 17
+    x_balance = ((x >> 2) & 0x0F) * 17
+    y_balance = ((y >> 2) & 0x0F) * 17
+    mix[_MIX_X_BALANCE] = x_balance
+    mix[_MIX_Y_BALANCE] = y_balance
+    mix[_MIX_X_REST] = 255 - x_balance
+    mix[_MIX_Y_REST] = 255 - y_balance
+
+
+@micropython.viper
+def _read_drum_map(drum_map, mix, step: int, instrument: int) -> int:
+    dm = ptr32(drum_map)
+    m = ptr8(mix)
+    x_balance, x_rest = m[_MIX_X_BALANCE], m[_MIX_X_REST]
+
+    nodes = dm[(((instrument * 32) + step) * _MAP_STEP_STRIDE) + m[_MIX_CELL]]
+    a = nodes & 0xFF
+    b = (nodes >> 8) & 0xFF
+    c = (nodes >> 16) & 0xFF
+    d = (nodes >> 24) & 0xFF
+
+    # The u8 mixes are inlined, a call out of viper would box every argument
+    ab = ((b * x_balance) + (a * x_rest)) >> 8
+    cd = ((d * x_balance) + (c * x_rest)) >> 8
+    return ((cd * m[_MIX_Y_BALANCE]) + (ab * m[_MIX_Y_REST])) >> 8
+
+
+# The three channels' values for a step are packed into one int, 10 bits
+# per channel, so they can be thresholded together without any branches.
+# 10 bits leaves room for the carry out of a byte sum, and three lanes still
+# fit in a MicroPython small int
+_LANES_BIT8 = const((1 << 8) | (1 << 18) | (1 << 28))
+_LANES_ONE = const(1 | (1 << 10) | (1 << 20))
+_LANES_ACCENT = const((255 - 192) * _LANES_ONE)
+
+
+# Trigger bit for each channel in the evaluated state
+_BIT = (1, 2, 4)
+
+
+def _pack_lanes(a, b, c):
+    return a | (b << 10) | (c << 20)
+
+
+@micropython.viper
+def _fill_triggers(levels, perturbation: int, density: int, triggers):
+    # Trigger and accent bits for all 32 steps in one call, one output byte
+    # per step
+    src = ptr32(levels)
+    out = ptr8(triggers)
+    for step in range(32):
+        # Add the perturbation to each level, saturating lanes at 255. The
+        # mixed levels are never above 255, so without perturbation they
+        # are thresholded as they are
+        lanes = src[step]
+        if perturbation:
+            lanes += perturbation
+            over = ((lanes + _LANES_ONE) & _LANES_BIT8) >> 8
+            lanes = (lanes & ~(over * 0x3FF)) | (over * 0xFF)
+
+        # level > 255 - density is level + density > 255, which sets bit 8
+        # of the lane. Accents also need level > 192, same trick
+        fired = (lanes + density) & _LANES_BIT8
+        accents = (lanes + _LANES_ACCENT) & fired
+
+        # Gather bit 8 of each lane into bits 0-2 for triggers, 3-5 for
+        # accents
+        out[step] = (((fired >> 8) | (fired >> 17) | (fired >> 26)) & 0x07) | (
+            ((accents >> 5) | (accents >> 14) | (accents >> 23)) & 0x38
+        )
+
+
+@micropython.viper
+def _mix_drum_map(drum_map, mix, active: int, levels):
+    # Same interpolation as _read_drum_map, for all 3 instruments x 32 steps
+    # at once. Each step's instrument levels are packed into lanes in
+    # levels[step]. Instruments without their bit in active are left at 0,
+    # with no density they can't trigger whatever the level is
+    dm = ptr32(drum_map)
+    m = ptr8(mix)
+    out = ptr32(levels)
+
+    cell = m[_MIX_CELL]
+    x_balance, y_balance = m[_MIX_X_BALANCE], m[_MIX_Y_BALANCE]
+    x_rest, y_rest = m[_MIX_X_REST], m[_MIX_Y_REST]
+
+    # Unrolled across the three instruments, whose slabs for a step are
+    # _MAP_INSTRUMENT_STRIDE apart, so each step's lanes are stored once
+    base = cell
+    for step in range(32):
+        level0 = 0
+        if active & 1:
+            nodes = dm[base]
+            a = nodes & 0xFF
+            b = (nodes >> 8) & 0xFF
+            c = (nodes >> 16) & 0xFF
+            d = (nodes >> 24) & 0xFF
+            ab = ((b * x_balance) + (a * x_rest)) >> 8
+            cd = ((d * x_balance) + (c * x_rest)) >> 8
+            level0 = ((cd * y_balance) + (ab * y_rest)) >> 8
+
+        i = base + _MAP_INSTRUMENT_STRIDE
+        level1 = 0
+        if active & 2:
+            nodes = dm[i]
+            a = nodes & 0xFF
+            b = (nodes >> 8) & 0xFF
+            c = (nodes >> 16) & 0xFF
+            d = (nodes >> 24) & 0xFF
+            ab = ((b * x_balance) + (a * x_rest)) >> 8
+            cd = ((d * x_balance) + (c * x_rest)) >> 8
+            level1 = ((cd * y_balance) + (ab * y_rest)) >> 8
+
+        i += _MAP_INSTRUMENT_STRIDE
+        level2 = 0
+        if active & 4:
+            nodes = dm[i]
+            a = nodes & 0xFF
+            b = (nodes >> 8) & 0xFF
+            c = (nodes >> 16) & 0xFF
+            d = (nodes >> 24) & 0xFF
+            ab = ((b * x_balance) + (a * x_rest)) >> 8
+            cd = ((d * x_balance) + (c * x_rest)) >> 8
+            level2 = ((cd * y_balance) + (ab * y_rest)) >> 8
+
+        out[step] = level0 | (level1 << 10) | (level2 << 20)
+        base += _MAP_STEP_STRIDE
+
+
+class _DensityView:
+    # What PatternGenerator.density returns. Writes like pg.density[0] = 64
+    # go through set_density(), so the cached pattern is refreshed
+
+    def __init__(self, generator):
+        self._generator = generator
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, channel):
+        return self._generator._density[channel]
+
+    def __setitem__(self, channel, value):
+        self._generator.set_density(channel, value)
+
+    def __iter__(self):
+        return iter(self._generator._density)
+
+    def __repr__(self):
+        return repr(self._generator._density)
+
 
 class PatternGenerator:
     CLOCK_RESOLUTION_4_PPQN = 0
     CLOCK_RESOLUTION_8_PPQN = 1
     CLOCK_RESOLUTION_24_PPQN = 2
 
-    def __init__(self):
-        self.x = 128
-        self.y = 128
+    def __init__(self, seed=None):
+        self._x = 128
+        self._y = 128
         self.randomness = 0
-        self.density = array("B", [128, 128, 128])  # One for each channel
+        self._density = bytearray([128, 128, 128])  # One for each channel
         self.step = 0
         self.pulse = 0
-        self.euclidean_step = array("B", [0, 0, 0])
-        self.output_mode = "grids"  # 'grids' or 'euclidean'
+        self.euclidean_step = bytearray(3)
+        # Cell and balances for the current x and y, see _compute_mix
+        self._mix = bytearray(5)
+        _compute_mix(self._x, self._y, self._mix)
+        self.set_output_mode("grids")
         self.clock_resolution = self.CLOCK_RESOLUTION_24_PPQN
         self.pulses_per_step = 3  # Default for 24 PPQN
-        self.part_perturbation = array("B", [0, 0, 0])
+        self.part_perturbation = bytearray(3)
+
+        # xorshift32 state for the per-bar perturbation, kept in a buffer so
+        # the viper code can step it without boxing a 32 bit int
+        self._rng = array("I", [1])
+        self.seed(seed)
 
         # Initialize drum map nodes
         self.drum_map = self._initialize_drum_map()
         self.euclidean_patterns = self._initialize_euclidean_patterns()
 
+        # Drum map levels at (x, y) for each step (one lane per instrument),
+        # and the trigger and accent bits they give for each of the 32 steps
+        # with this bar's perturbation added. Rebuilt lazily whenever x, y or
+        # density change, and the trigger bits again whenever a new bar rolls
+        # its perturbation
+        self._levels = array("I", [0] * 32)
+        self._density_lanes = 0
+        self._perturbation_lanes = 0
+        self._trigger_cache = bytearray(32)
+        self._dirty = True
+
+        # The levels only depend on x and y, so a density change just
+        # rethresholds them unless it brings back a channel that was skipped
+        # while muted. _mixed has a bit for each channel with valid levels
+        self._levels_dirty = True
+        self._mixed = 0
+
+        # Euclidean trigger bit for each channel and step, at channel * 32 +
+        # step. Updated whenever that channel's density changes
+        self._euclidean_board = bytearray(96)
+        for i in range(3):
+            self._update_euclidean_board(i)
+
+    def seed(self, value=None):
+        # Seeds the per-bar perturbation, so a given seed always plays the
+        # same bars. Without one it is seeded from urandom
+        if value is None:
+            value = int.from_bytes(urandom(4), "little")
+        # xorshift32 never leaves a zero state
+        self._rng[0] = (value & 0xFFFFFFFF) or 1
+
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        # The map is only blended in steps of 4, so smaller moves within a
+        # step don't change the pattern
+        changed = (value >> 2) != (self._x >> 2)
+        self._x = value
+        if changed:
+            self._recompute_mix()
+
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        changed = (value >> 2) != (self._y >> 2)
+        self._y = value
+        if changed:
+            self._recompute_mix()
+
+    def _recompute_mix(self):
+        _compute_mix(self._x, self._y, self._mix)
+        self._levels_dirty = True
+        self._dirty = True
+
+    @property
+    def density(self):
+        return _DensityView(self)
+
+    @density.setter
+    def density(self, value):
+        if len(value) != 3:
+            raise ValueError("Invalid density, need one value per channel")
+        self._density = bytearray(value)
+        self._dirty = True
+        for i in range(3):
+            self._update_euclidean_board(i)
+
+    def set_density(self, channel, value):
+        self._density[channel] = value
+        self._dirty = True
+        self._update_euclidean_board(channel)
+
+    def _update_euclidean_board(self, channel):
+        length = (self._density[channel] >> 5) + 1  # 1 to 8
+        pattern = self.euclidean_patterns[length - 1]
+        bit = _BIT[channel]
+        board, offset = self._euclidean_board, channel * 32
+        for step in range(32):
+            # Shift the pattern down rather than building 1 << step, which is
+            # past the small int range on MicroPython for the top steps
+            board[offset + step] = bit if (pattern >> step) & 1 else 0
+
+    @property
+    def output_mode(self):
+        return self._output_mode
+
+    @output_mode.setter
+    def output_mode(self, mode):
+        self.set_output_mode(mode)
+
+    def set_output_mode(self, mode):
+        # 'grids' or 'euclidean'. evaluate() calls through _evaluate_fn, so
+        # the mode is resolved here rather than on every tick
+        self._output_mode = mode
+        if mode == "grids":
+            self._evaluate_fn = self.evaluate_drums
+        else:
+            self._evaluate_fn = self.evaluate_euclidean
+
     def set_clock_resolution(self, resolution):
         self.clock_resolution = resolution
         if resolution == self.CLOCK_RESOLUTION_4_PPQN:
@@ -35,96 +379,115 @@ class PatternGenerator:
             self.pulses_per_step = 3
 
     def _initialize_drum_map(self):
-        from .resources_drum_map import drum_map
-
-        return drum_map
+        return _DRUM_MAP
 
     def _initialize_euclidean_patterns(self):
-        from .resources_euclidean import euclidean_patterns
-
-        return euclidean_patterns
-
-    def _u8_mix(self, a, b, balance):
-        return ((b * balance) + (a * (255 - balance))) >> 8
+        return _EUCLIDEAN_ROW0
 
     def read_drum_map(self, step, instrument):
-        x, y = self.x, self.y
-        i, j = x >> 6, y >> 6
-
-        offset = (instrument * 32) + step
-
-        a_map = self.drum_map[i][j]
-        b_map = self.drum_map[min(i + 1, 4)][j]
-        c_map = self.drum_map[i][min(j + 1, 4)]
-        d_map = self.drum_map[min(i + 1, 4)][min(j + 1, 4)]
+        if not (0 <= step < 32 and 0 <= instrument < 3):
+            raise IndexError("Invalid step or instrument")
+        return _read_drum_map(self.drum_map, self._mix, step, instrument)
+
+    @micropython.native
+    def _refresh_cache(self):
+        levels, density = self._levels, self._density
+        d0, d1, d2 = density[0], density[1], density[2]
+        active = (1 if d0 else 0) | (2 if d1 else 0) | (4 if d2 else 0)
+        if self._levels_dirty or (active & ~self._mixed):
+            _mix_drum_map(self.drum_map, self._mix, active, levels)
+            self._mixed = active
+            self._levels_dirty = False
+
+        self._density_lanes = density_lanes = _pack_lanes(d0, d1, d2)
+
+        _fill_triggers(
+            levels, self._perturbation_lanes, density_lanes, self._trigger_cache
+        )
 
-        a = a_map[offset]
-        b = b_map[offset]
-        c = c_map[offset]
-        d = d_map[offset]
+        self._dirty = False
+
+    def refresh(self):
+        # Rebuild the cached pattern now if anything changed, rather than on
+        # the next evaluate(), eg. before starting a real-time clock
+        if self._dirty:
+            self._refresh_cache()
+
+    @micropython.viper
+    def _roll_perturbation(self):
+        # One xorshift32 (13, 17, 5) step per bar, its low three bytes scaled
+        # by randomness. The shifts are masked so the state stays within 32
+        # bits on CPython and the right shift is logical on signed viper ints
+        rng = ptr32(self._rng)
+        s = rng[0]
+        s ^= (s & 0x7FFFF) << 13
+        s ^= (s >> 17) & 0x7FFF
+        s ^= (s & 0x7FFFFFF) << 5
+        rng[0] = s
+
+        r = int(self.randomness)
+        p0 = ((s & 0xFF) * r) >> 8
+        p1 = (((s >> 8) & 0xFF) * r) >> 8
+        p2 = (((s >> 16) & 0xFF) * r) >> 8
+
+        perturbation = ptr8(self.part_perturbation)
+        perturbation[0] = p0
+        perturbation[1] = p1
+        perturbation[2] = p2
+        lanes = p0 | (p1 << 10) | (p2 << 20)
+        self._perturbation_lanes = lanes
+        _fill_triggers(
+            self._levels, lanes, int(self._density_lanes), self._trigger_cache
+        )
 
-        x_balance = (x & 0x3F) << 2
-        y_balance = (y & 0x3F) << 2
+    @micropython.viper
+    def evaluate_drums(self) -> int:
+        step = int(self.step)
+        if self._dirty:
+            self._refresh_cache()
 
-        return self._u8_mix(
-            self._u8_mix(a, b, x_balance), self._u8_mix(c, d, x_balance), y_balance
-        )
+        # The perturbation is rolled at the start of every bar, even with no
+        # randomness, and held until the next one whatever randomness does in
+        # between. So the bar's triggers are all worked out when it is rolled,
+        # and served from the cache
+        if step == 0:
+            self._roll_perturbation()
 
-    def evaluate_drums(self):
-        state = 0
-        accent_bits = 0
-        
-        if self.step == 0:
-            for i in range(3):
-                self.part_perturbation[i] = (random.randint(0, 255) * self.randomness) >> 8
-
-        for i in range(3):  # For each channel
-            level = self.read_drum_map(self.step, i)
-            if level < 255 - self.part_perturbation[i]:
-                level += self.part_perturbation[i]
-            else:
-                level = 255
-            
-            threshold = 255 - self.density[i]
-            if level > threshold:
-                state |= 1 << i
-                if level > 192:  # Accent threshold
-                    accent_bits |= 1 << i
-
-        # Combine state and accent bits
-        # Use bits 0-2 for triggers, 3-5 for accents
-        combined_state = state | (accent_bits << 3)
+        triggers = ptr8(self._trigger_cache)
+        combined_state = triggers[step]
 
         # Add clock and reset bits if needed
         # Assuming OUTPUT_BIT_CLOCK is bit 6 and OUTPUT_BIT_RESET is bit 7
         combined_state |= 1 << 6  # Always set clock bit
-        if self.step == 0:
+        if step == 0:
             combined_state |= 1 << 7  # Set reset bit at start of pattern
 
         return combined_state
 
-    def evaluate_euclidean(self):
-        state = 0
-        for i in range(3):  # For each channel
-            length = (self.density[i] >> 5) + 1  # 1 to 8
-            pattern = self.euclidean_patterns[length - 1]
-            if pattern & (1 << self.euclidean_step[i]):
-                state |= 1 << i
-            self.euclidean_step[i] = (self.euclidean_step[i] + 1) % 32
+    @micropython.viper
+    def evaluate_euclidean(self) -> int:
+        board = ptr8(self._euclidean_board)
+        steps = ptr8(self.euclidean_step)
+        s0, s1, s2 = steps[0], steps[1], steps[2]
+        state = board[s0] | board[32 + s1] | board[64 + s2]
+        steps[0] = (s0 + 1) & 31
+        steps[1] = (s1 + 1) & 31
+        steps[2] = (s2 + 1) & 31
         return state
 
+    @micropython.native
     def tick_clock(self, num_pulses=1):
-        self.pulse += num_pulses
-        if self.pulse >= self.pulses_per_step:
-            self.pulse -= self.pulses_per_step
-            self.step = (self.step + 1) % 32
-
+        pulse = self.pulse + num_pulses
+        pulses_per_step = self.pulses_per_step
+        if pulse >= pulses_per_step:
+            pulse -= pulses_per_step
+            self.step = (self.step + 1) & 31
+        self.pulse = pulse
+
+    @micropython.native
     def evaluate(self):
         if self.pulse == 0:
-            if self.output_mode == "grids":
-                return self.evaluate_drums()
-            else:
-                return self.evaluate_euclidean()
+            return self._evaluate_fn()
         return 0
 
 
@@ -133,12 +496,12 @@ def main():
 
     pg.x = random.randint(0, 255)
     pg.y = random.randint(0, 255)
-    pg.density = array(
-        "B", [random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)]
+    pg.density = bytearray(
+        [random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)]
     )
     pg.randomness = random.randint(0, 255)  # Set a random value for randomness
 
-    print("x, y, density, randomness: ", pg.x, pg.y, pg.density, pg.randomness)
+    print("x, y, density, randomness: ", pg.x, pg.y, list(pg.density), pg.randomness)
 
     resolutions = [
         (PatternGenerator.CLOCK_RESOLUTION_4_PPQN, "4 PPQN"),
@@ -155,7 +518,7 @@ def main():
             for channel in range(3):
                 # TODO: Different character of accented beats
                 pattern[step // pg.pulses_per_step][channel] += (
-                    "*" if output & (1 << channel) else "-"
+                    "*" if output & _BIT[channel] else "-"
                 )
             pg.tick_clock()
 
@@ -170,7 +533,7 @@ def main():
             output = pg.evaluate()
             for channel in range(3):
                 pattern[step // pg.pulses_per_step][channel] += (
-                    "*" if output & (1 << channel) else "-"
+                    "*" if output & _BIT[channel] else "-"
                 )
             pg.tick_clock()
 
@@ -1,165 +1,192 @@
 # fmt: off
-from array import array
+# Generated by scripts/pack_drum_map.py, don't edit by hand
 
-# Node arrays: 
+# The 25 nodes of the 5x5 grid, 96 bytes each, node (i, j) starting at
+# ((i * 5) + j) * 96. Within a node:
 # 0 -  31: BD
 # 32 - 63: SD
 # 64 - 96: HH
-node_0 = array('B', [
-    255, 0, 0, 0, 0, 0, 145, 0, 0, 0, 0, 0, 218, 0, 0, 0, 72, 0, 36, 0, 182, 0, 0, 0, 109, 0, 0, 0, 72, 0, 0, 0,
-    36, 0, 109, 0, 0, 0, 8, 0, 255, 0, 0, 0, 0, 0, 72, 0, 0, 0, 182, 0, 0, 0, 36, 0, 218, 0, 0, 0, 145, 0, 0, 0,
-    170, 0, 113, 0, 255, 0, 56, 0, 170, 0, 141, 0, 198, 0, 56, 0, 170, 0, 113, 0, 226, 0, 28, 0, 170, 0, 113, 0, 198, 0, 85, 0
-])
-
-node_1 = array('B', [
-    229, 0, 25, 0, 102, 0, 25, 0, 204, 0, 25, 0, 76, 0, 8, 0, 255, 0, 8, 0, 51, 0, 25, 0, 178, 0, 25, 0, 153, 0, 127, 0,
-    28, 0, 198, 0, 56, 0, 56, 0, 226, 0, 28, 0, 141, 0, 28, 0, 28, 0, 170, 0, 28, 0, 28, 0, 255, 0, 113, 0, 85, 0, 85, 0,
-    159, 0, 159, 0, 255, 0, 63, 0, 159, 0, 159, 0, 191, 0, 31, 0, 159, 0, 127, 0, 255, 0, 31, 0, 159, 0, 127, 0, 223, 0, 95, 0
-])
-
-node_2 = array('B', [
-    255, 0, 0, 0, 127, 0, 0, 0, 0, 0, 102, 0, 0, 0, 229, 0, 0, 0, 178, 0, 204, 0, 0, 0, 76, 0, 51, 0, 153, 0, 25, 0,
-    0, 0, 127, 0, 0, 0, 0, 0, 255, 0, 191, 0, 31, 0, 63, 0, 0, 0, 95, 0, 0, 0, 0, 0, 223, 0, 0, 0, 31, 0, 159, 0,
-    255, 0, 85, 0, 148, 0, 85, 0, 127, 0, 85, 0, 106, 0, 63, 0, 212, 0, 170, 0, 191, 0, 170, 0, 85, 0, 42, 0, 233, 0, 21, 0
-])
-
-node_3 = array('B', [
-    255, 0, 212, 0, 63, 0, 0, 0, 106, 0, 148, 0, 85, 0, 127, 0, 191, 0, 21, 0, 233, 0, 0, 0, 21, 0, 170, 0, 0, 0, 42, 0,
-    0, 0, 0, 0, 141, 0, 113, 0, 255, 0, 198, 0, 0, 0, 56, 0, 0, 0, 85, 0, 56, 0, 28, 0, 226, 0, 28, 0, 170, 0, 56, 0,
-    255, 0, 231, 0, 255, 0, 208, 0, 139, 0, 92, 0, 115, 0, 92, 0, 185, 0, 69, 0, 46, 0, 46, 0, 162, 0, 23, 0, 208, 0, 46, 0
-])
-
-node_4 = array('B', [
-    255, 0, 31, 0, 63, 0, 63, 0, 127, 0, 95, 0, 191, 0, 63, 0, 223, 0, 31, 0, 159, 0, 63, 0, 31, 0, 63, 0, 95, 0, 31, 0,
-    8, 0, 0, 0, 95, 0, 63, 0, 255, 0, 0, 0, 127, 0, 0, 0, 8, 0, 0, 0, 159, 0, 63, 0, 255, 0, 223, 0, 191, 0, 31, 0,
-    76, 0, 25, 0, 255, 0, 127, 0, 153, 0, 51, 0, 204, 0, 102, 0, 76, 0, 51, 0, 229, 0, 127, 0, 153, 0, 51, 0, 178, 0, 102, 0
-])
-
-node_5 = array('B', [
-    255, 0, 51, 0, 25, 0, 76, 0, 0, 0, 0, 0, 102, 0, 0, 0, 204, 0, 229, 0, 0, 0, 178, 0, 0, 0, 153, 0, 127, 0, 8, 0,
-    178, 0, 127, 0, 153, 0, 204, 0, 255, 0, 0, 0, 25, 0, 76, 0, 102, 0, 51, 0, 0, 0, 0, 0, 229, 0, 25, 0, 25, 0, 204, 0,
-    178, 0, 102, 0, 255, 0, 76, 0, 127, 0, 76, 0, 229, 0, 76, 0, 153, 0, 102, 0, 255, 0, 25, 0, 127, 0, 51, 0, 204, 0, 51, 0
-])
-
-node_6 = array('B', [
-    255, 0, 0, 0, 223, 0, 0, 0, 31, 0, 8, 0, 127, 0, 0, 0, 95, 0, 0, 0, 159, 0, 0, 0, 95, 0, 63, 0, 191, 0, 0, 0,
-    51, 0, 204, 0, 0, 0, 102, 0, 255, 0, 127, 0, 8, 0, 178, 0, 25, 0, 229, 0, 0, 0, 76, 0, 204, 0, 153, 0, 51, 0, 25, 0,
-    255, 0, 226, 0, 255, 0, 255, 0, 198, 0, 28, 0, 141, 0, 56, 0, 170, 0, 56, 0, 85, 0, 28, 0, 170, 0, 28, 0, 113, 0, 56, 0
-])
-
-node_7 = array('B', [
-    223, 0, 0, 0, 63, 0, 0, 0, 95, 0, 0, 0, 223, 0, 31, 0, 255, 0, 0, 0, 159, 0, 0, 0, 127, 0, 31, 0, 191, 0, 31, 0,
-    0, 0, 0, 0, 109, 0, 0, 0, 218, 0, 0, 0, 182, 0, 72, 0, 8, 0, 36, 0, 145, 0, 36, 0, 255, 0, 8, 0, 182, 0, 72, 0,
-    255, 0, 72, 0, 218, 0, 36, 0, 218, 0, 0, 0, 145, 0, 0, 0, 255, 0, 36, 0, 182, 0, 36, 0, 182, 0, 0, 0, 109, 0, 0, 0
-])
-
-node_8 = array('B', [
-    255, 0, 0, 0, 218, 0, 0, 0, 36, 0, 0, 0, 218, 0, 0, 0, 182, 0, 109, 0, 255, 0, 0, 0, 0, 0, 0, 0, 145, 0, 72, 0,
-    159, 0, 0, 0, 31, 0, 127, 0, 255, 0, 31, 0, 0, 0, 95, 0, 8, 0, 0, 0, 191, 0, 31, 0, 255, 0, 31, 0, 223, 0, 63, 0,
-    255, 0, 31, 0, 63, 0, 31, 0, 95, 0, 31, 0, 63, 0, 127, 0, 159, 0, 31, 0, 63, 0, 31, 0, 223, 0, 223, 0, 191, 0, 191, 0
-])
-
-node_9 = array('B', [
-    226, 0, 28, 0, 28, 0, 141, 0, 8, 0, 8, 0, 255, 0, 8, 0, 113, 0, 28, 0, 198, 0, 85, 0, 56, 0, 198, 0, 170, 0, 28, 0,
-    8, 0, 95, 0, 8, 0, 8, 0, 255, 0, 63, 0, 31, 0, 223, 0, 8, 0, 31, 0, 191, 0, 8, 0, 255, 0, 127, 0, 127, 0, 159, 0,
-    115, 0, 46, 0, 255, 0, 185, 0, 139, 0, 23, 0, 208, 0, 115, 0, 231, 0, 69, 0, 255, 0, 162, 0, 139, 0, 115, 0, 231, 0, 92, 0
-])
-
-node_10 = array('B', [
-    145, 0, 0, 0, 0, 0, 109, 0, 0, 0, 0, 0, 255, 0, 109, 0, 72, 0, 218, 0, 0, 0, 0, 0, 36, 0, 0, 0, 182, 0, 0, 0,
-    0, 0, 127, 0, 159, 0, 127, 0, 159, 0, 191, 0, 223, 0, 63, 0, 255, 0, 95, 0, 31, 0, 95, 0, 31, 0, 8, 0, 63, 0, 8, 0,
-    255, 0, 0, 0, 145, 0, 0, 0, 182, 0, 109, 0, 109, 0, 109, 0, 218, 0, 0, 0, 72, 0, 0, 0, 182, 0, 72, 0, 182, 0, 36, 0
-])
-
-node_11 = array('B', [
-    255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 255, 0, 0, 0, 218, 0, 72, 36, 0, 0, 182, 0, 0, 0, 145, 109,
-    0, 0, 127, 0, 0, 0, 42, 0, 212, 0, 0, 212, 0, 0, 212, 0, 0, 0, 0, 0, 42, 0, 0, 0, 255, 0, 0, 0, 170, 170, 127, 85,
-    145, 0, 109, 109, 218, 109, 72, 0, 145, 0, 72, 0, 218, 0, 109, 0, 182, 0, 109, 0, 255, 0, 72, 0, 182, 109, 36, 109, 255, 109, 109, 0
-])
-
-node_12 = array('B', [
-    255, 0, 0, 0, 255, 0, 191, 0, 0, 0, 0, 0, 95, 0, 63, 0, 31, 0, 0, 0, 223, 0, 223, 0, 0, 0, 8, 0, 159, 0, 127, 0,
-    0, 0, 85, 0, 56, 0, 28, 0, 255, 0, 28, 0, 0, 0, 226, 0, 0, 0, 170, 0, 56, 0, 113, 0, 198, 0, 0, 0, 113, 0, 141, 0,
-    255, 0, 42, 0, 233, 0, 63, 0, 212, 0, 85, 0, 191, 0, 106, 0, 191, 0, 21, 0, 170, 0, 8, 0, 170, 0, 127, 0, 148, 0, 148, 0
-])
-
-node_13 = array('B', [
-    255, 0, 0, 0, 0, 0, 63, 0, 191, 0, 95, 0, 31, 0, 223, 0, 255, 0, 63, 0, 95, 0, 63, 0, 159, 0, 0, 0, 0, 0, 127, 0,
-    72, 0, 0, 0, 0, 0, 0, 0, 255, 0, 0, 0, 0, 0, 0, 0, 72, 0, 72, 0, 36, 0, 8, 0, 218, 0, 182, 0, 145, 0, 109, 0,
-    255, 0, 162, 0, 231, 0, 162, 0, 231, 0, 115, 0, 208, 0, 139, 0, 185, 0, 92, 0, 185, 0, 46, 0, 162, 0, 69, 0, 162, 0, 23, 0
-])
-
-node_14 = array('B', [
-    255, 0, 0, 0, 51, 0, 0, 0, 0, 0, 0, 0, 102, 0, 0, 0, 204, 0, 0, 0, 153, 0, 0, 0, 0, 0, 0, 0, 51, 0, 0, 0,
-    0, 0, 0, 0, 8, 0, 36, 0, 255, 0, 0, 0, 182, 0, 8, 0, 0, 0, 0, 0, 72, 0, 109, 0, 145, 0, 0, 0, 255, 0, 218, 0,
-    212, 0, 8, 0, 170, 0, 0, 0, 127, 0, 0, 0, 85, 0, 8, 0, 255, 0, 8, 0, 170, 0, 0, 0, 127, 0, 0, 0, 42, 0, 8, 0
-])
-
-node_15 = array('B', [
-    255, 0, 0, 0, 0, 0, 0, 0, 36, 0, 0, 0, 182, 0, 0, 0, 218, 0, 0, 0, 0, 0, 0, 0, 72, 0, 0, 0, 145, 0, 109, 0,
-    36, 0, 36, 0, 0, 0, 0, 0, 255, 0, 0, 0, 182, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 109, 218, 0, 0, 0, 145, 0, 72, 72,
-    255, 0, 28, 0, 226, 0, 56, 0, 198, 0, 0, 0, 0, 0, 28, 28, 170, 0, 0, 0, 141, 0, 0, 0, 113, 0, 0, 0, 85, 85, 85, 85
-])
-
-node_16 = array('B', [
-    255, 0, 0, 0, 0, 0, 95, 0, 0, 0, 127, 0, 0, 0, 0, 0, 223, 0, 95, 0, 63, 0, 31, 0, 191, 0, 0, 0, 159, 0, 0, 0,
-    0, 0, 31, 0, 255, 0, 0, 0, 0, 0, 95, 0, 223, 0, 0, 0, 0, 0, 63, 0, 191, 0, 0, 0, 0, 0, 0, 0, 159, 0, 127, 0,
-    141, 0, 28, 0, 28, 0, 28, 0, 113, 0, 8, 0, 8, 0, 8, 0, 255, 0, 0, 0, 226, 0, 0, 0, 198, 0, 56, 0, 170, 0, 85, 0
-])
-
-node_17 = array('B', [
-    255, 0, 0, 0, 8, 0, 0, 0, 182, 0, 0, 0, 72, 0, 0, 0, 218, 0, 0, 0, 36, 0, 0, 0, 145, 0, 0, 0, 109, 0, 0, 0,
-    0, 0, 51, 25, 76, 25, 25, 0, 153, 0, 0, 0, 127, 102, 178, 0, 204, 0, 0, 0, 0, 0, 255, 0, 0, 0, 102, 0, 229, 0, 76, 0,
-    113, 0, 0, 0, 141, 0, 85, 0, 0, 0, 0, 0, 170, 0, 0, 0, 56, 28, 255, 0, 0, 0, 0, 0, 198, 0, 0, 0, 226, 0, 0, 0
-])
-
-node_18 = array('B', [
-    255, 0, 8, 0, 28, 0, 28, 0, 198, 0, 56, 0, 56, 0, 85, 0, 255, 0, 85, 0, 113, 0, 113, 0, 226, 0, 141, 0, 170, 0, 141, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 255, 0, 0, 0, 127, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63, 0, 0, 0, 191, 0, 0, 0,
-    255, 0, 0, 0, 255, 0, 127, 0, 0, 0, 85, 0, 0, 0, 212, 0, 0, 0, 212, 0, 42, 0, 170, 0, 0, 0, 127, 0, 0, 0, 0, 0
-])
-
-node_19 = array('B', [
-    255, 0, 0, 0, 0, 0, 218, 0, 182, 0, 0, 0, 0, 0, 145, 0, 145, 0, 36, 0, 0, 0, 109, 0, 109, 0, 0, 0, 72, 0, 36, 0,
-    0, 0, 0, 0, 109, 0, 8, 0, 72, 0, 0, 0, 255, 0, 182, 0, 0, 0, 0, 0, 145, 0, 8, 0, 36, 0, 8, 0, 218, 0, 182, 0,
-    255, 0, 0, 0, 0, 0, 226, 0, 85, 0, 0, 0, 141, 0, 0, 0, 0, 0, 0, 0, 170, 0, 56, 0, 198, 0, 0, 0, 113, 0, 28, 0
-])
-
-node_20 = array('B', [
-    255, 0, 0, 0, 113, 0, 0, 0, 198, 0, 56, 0, 85, 0, 28, 0, 255, 0, 0, 0, 226, 0, 0, 0, 170, 0, 0, 0, 141, 0, 0, 0,
-    0, 0, 0, 0, 0, 0, 0, 0, 255, 0, 145, 0, 109, 0, 218, 0, 36, 0, 182, 0, 72, 0, 72, 0, 255, 0, 0, 0, 0, 0, 109, 0,
-    36, 0, 36, 0, 145, 0, 0, 0, 72, 0, 72, 0, 182, 0, 0, 0, 72, 0, 72, 0, 218, 0, 0, 0, 109, 0, 109, 0, 255, 0, 0, 0
-])
-
-node_21 = array('B', [
-    255, 0, 0, 0, 218, 0, 0, 0, 145, 0, 0, 0, 36, 0, 0, 0, 218, 0, 0, 0, 36, 0, 0, 0, 182, 0, 72, 0, 0, 0, 109, 0,
-    0, 0, 0, 0, 8, 0, 0, 0, 255, 0, 85, 0, 212, 0, 42, 0, 0, 0, 0, 0, 8, 0, 0, 0, 85, 0, 170, 0, 127, 0, 42, 0,
-    109, 0, 109, 0, 255, 0, 0, 0, 72, 0, 72, 0, 218, 0, 0, 0, 145, 0, 182, 0, 255, 0, 0, 0, 36, 0, 36, 0, 218, 0, 8, 0
-])
-
-node_22 = array('B', [
-    255, 0, 0, 0, 42, 0, 0, 0, 212, 0, 0, 0, 8, 0, 212, 0, 170, 0, 0, 0, 85, 0, 0, 0, 212, 0, 8, 0, 127, 0, 8, 0,
-    255, 0, 85, 0, 0, 0, 0, 0, 226, 0, 85, 0, 0, 0, 198, 0, 0, 0, 141, 0, 56, 0, 0, 0, 170, 0, 28, 0, 0, 0, 113, 0,
-    113, 0, 56, 0, 255, 0, 0, 0, 85, 0, 56, 0, 226, 0, 0, 0, 0, 0, 170, 0, 0, 0, 141, 0, 28, 0, 28, 0, 198, 0, 28, 0
-])
-
-node_23 = array('B', [
-    255, 0, 0, 0, 229, 0, 0, 0, 204, 0, 204, 0, 0, 0, 76, 0, 178, 0, 153, 0, 51, 0, 178, 0, 178, 0, 127, 0, 102, 51, 51, 25,
-    0, 0, 0, 0, 0, 0, 0, 31, 0, 0, 0, 0, 255, 0, 0, 31, 0, 0, 8, 0, 0, 0, 191, 159, 127, 95, 95, 0, 223, 0, 63, 0,
-    255, 0, 255, 0, 204, 204, 204, 204, 0, 0, 51, 51, 51, 51, 0, 0, 204, 0, 204, 0, 153, 153, 153, 153, 153, 0, 0, 0, 102, 102, 102, 102
-])
-
-node_24 = array('B', [
-    170, 0, 0, 0, 0, 255, 0, 0, 198, 0, 0, 0, 0, 28, 0, 0, 141, 0, 0, 0, 0, 226, 0, 0, 56, 0, 0, 113, 0, 85, 0, 0,
-    255, 0, 0, 0, 0, 113, 0, 0, 85, 0, 0, 0, 0, 226, 0, 0, 141, 0, 0, 8, 0, 170, 56, 56, 198, 0, 0, 56, 0, 141, 28, 0,
-    255, 0, 0, 0, 0, 191, 0, 0, 159, 0, 0, 0, 0, 223, 0, 0, 95, 0, 0, 0, 0, 63, 0, 0, 127, 0, 0, 0, 0, 31, 0, 0
-])
-
-# Create the 5x5 grid of nodes
+drum_map_nodes = (
+    # (0, 0): node_10
+    b'\x91\x00\x00\x00\x00\x00\x6d\x00\x00\x00\x00\x00\xff\x00\x6d\x00'
+    b'\x48\x00\xda\x00\x00\x00\x00\x00\x24\x00\x00\x00\xb6\x00\x00\x00'
+    b'\x00\x00\x7f\x00\x9f\x00\x7f\x00\x9f\x00\xbf\x00\xdf\x00\x3f\x00'
+    b'\xff\x00\x5f\x00\x1f\x00\x5f\x00\x1f\x00\x08\x00\x3f\x00\x08\x00'
+    b'\xff\x00\x00\x00\x91\x00\x00\x00\xb6\x00\x6d\x00\x6d\x00\x6d\x00'
+    b'\xda\x00\x00\x00\x48\x00\x00\x00\xb6\x00\x48\x00\xb6\x00\x24\x00'
+    # (0, 1): node_8
+    b'\xff\x00\x00\x00\xda\x00\x00\x00\x24\x00\x00\x00\xda\x00\x00\x00'
+    b'\xb6\x00\x6d\x00\xff\x00\x00\x00\x00\x00\x00\x00\x91\x00\x48\x00'
+    b'\x9f\x00\x00\x00\x1f\x00\x7f\x00\xff\x00\x1f\x00\x00\x00\x5f\x00'
+    b'\x08\x00\x00\x00\xbf\x00\x1f\x00\xff\x00\x1f\x00\xdf\x00\x3f\x00'
+    b'\xff\x00\x1f\x00\x3f\x00\x1f\x00\x5f\x00\x1f\x00\x3f\x00\x7f\x00'
+    b'\x9f\x00\x1f\x00\x3f\x00\x1f\x00\xdf\x00\xdf\x00\xbf\x00\xbf\x00'
+    # (0, 2): node_0
+    b'\xff\x00\x00\x00\x00\x00\x91\x00\x00\x00\x00\x00\xda\x00\x00\x00'
+    b'\x48\x00\x24\x00\xb6\x00\x00\x00\x6d\x00\x00\x00\x48\x00\x00\x00'
+    b'\x24\x00\x6d\x00\x00\x00\x08\x00\xff\x00\x00\x00\x00\x00\x48\x00'
+    b'\x00\x00\xb6\x00\x00\x00\x24\x00\xda\x00\x00\x00\x91\x00\x00\x00'
+    b'\xaa\x00\x71\x00\xff\x00\x38\x00\xaa\x00\x8d\x00\xc6\x00\x38\x00'
+    b'\xaa\x00\x71\x00\xe2\x00\x1c\x00\xaa\x00\x71\x00\xc6\x00\x55\x00'
+    # (0, 3): node_9
+    b'\xe2\x00\x1c\x00\x1c\x00\x8d\x00\x08\x00\x08\x00\xff\x00\x08\x00'
+    b'\x71\x00\x1c\x00\xc6\x00\x55\x00\x38\x00\xc6\x00\xaa\x00\x1c\x00'
+    b'\x08\x00\x5f\x00\x08\x00\x08\x00\xff\x00\x3f\x00\x1f\x00\xdf\x00'
+    b'\x08\x00\x1f\x00\xbf\x00\x08\x00\xff\x00\x7f\x00\x7f\x00\x9f\x00'
+    b'\x73\x00\x2e\x00\xff\x00\xb9\x00\x8b\x00\x17\x00\xd0\x00\x73\x00'
+    b'\xe7\x00\x45\x00\xff\x00\xa2\x00\x8b\x00\x73\x00\xe7\x00\x5c\x00'
+    # (0, 4): node_11
+    b'\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\xff\x00\x00\x00\xda\x00\x48\x24\x00\x00\xb6\x00\x00\x00\x91\x6d'
+    b'\x00\x00\x7f\x00\x00\x00\x2a\x00\xd4\x00\x00\xd4\x00\x00\xd4\x00'
+    b'\x00\x00\x00\x00\x2a\x00\x00\x00\xff\x00\x00\x00\xaa\xaa\x7f\x55'
+    b'\x91\x00\x6d\x6d\xda\x6d\x48\x00\x91\x00\x48\x00\xda\x00\x6d\x00'
+    b'\xb6\x00\x6d\x00\xff\x00\x48\x00\xb6\x6d\x24\x6d\xff\x6d\x6d\x00'
+    # (1, 0): node_15
+    b'\xff\x00\x00\x00\x00\x00\x00\x00\x24\x00\x00\x00\xb6\x00\x00\x00'
+    b'\xda\x00\x00\x00\x00\x00\x00\x00\x48\x00\x00\x00\x91\x00\x6d\x00'
+    b'\x24\x00\x24\x00\x00\x00\x00\x00\xff\x00\x00\x00\xb6\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x6d\xda\x00\x00\x00\x91\x00\x48\x48'
+    b'\xff\x00\x1c\x00\xe2\x00\x38\x00\xc6\x00\x00\x00\x00\x00\x1c\x1c'
+    b'\xaa\x00\x00\x00\x8d\x00\x00\x00\x71\x00\x00\x00\x55\x55\x55\x55'
+    # (1, 1): node_7
+    b'\xdf\x00\x00\x00\x3f\x00\x00\x00\x5f\x00\x00\x00\xdf\x00\x1f\x00'
+    b'\xff\x00\x00\x00\x9f\x00\x00\x00\x7f\x00\x1f\x00\xbf\x00\x1f\x00'
+    b'\x00\x00\x00\x00\x6d\x00\x00\x00\xda\x00\x00\x00\xb6\x00\x48\x00'
+    b'\x08\x00\x24\x00\x91\x00\x24\x00\xff\x00\x08\x00\xb6\x00\x48\x00'
+    b'\xff\x00\x48\x00\xda\x00\x24\x00\xda\x00\x00\x00\x91\x00\x00\x00'
+    b'\xff\x00\x24\x00\xb6\x00\x24\x00\xb6\x00\x00\x00\x6d\x00\x00\x00'
+    # (1, 2): node_13
+    b'\xff\x00\x00\x00\x00\x00\x3f\x00\xbf\x00\x5f\x00\x1f\x00\xdf\x00'
+    b'\xff\x00\x3f\x00\x5f\x00\x3f\x00\x9f\x00\x00\x00\x00\x00\x7f\x00'
+    b'\x48\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x00\x00\x00\x00'
+    b'\x48\x00\x48\x00\x24\x00\x08\x00\xda\x00\xb6\x00\x91\x00\x6d\x00'
+    b'\xff\x00\xa2\x00\xe7\x00\xa2\x00\xe7\x00\x73\x00\xd0\x00\x8b\x00'
+    b'\xb9\x00\x5c\x00\xb9\x00\x2e\x00\xa2\x00\x45\x00\xa2\x00\x17\x00'
+    # (1, 3): node_12
+    b'\xff\x00\x00\x00\xff\x00\xbf\x00\x00\x00\x00\x00\x5f\x00\x3f\x00'
+    b'\x1f\x00\x00\x00\xdf\x00\xdf\x00\x00\x00\x08\x00\x9f\x00\x7f\x00'
+    b'\x00\x00\x55\x00\x38\x00\x1c\x00\xff\x00\x1c\x00\x00\x00\xe2\x00'
+    b'\x00\x00\xaa\x00\x38\x00\x71\x00\xc6\x00\x00\x00\x71\x00\x8d\x00'
+    b'\xff\x00\x2a\x00\xe9\x00\x3f\x00\xd4\x00\x55\x00\xbf\x00\x6a\x00'
+    b'\xbf\x00\x15\x00\xaa\x00\x08\x00\xaa\x00\x7f\x00\x94\x00\x94\x00'
+    # (1, 4): node_6
+    b'\xff\x00\x00\x00\xdf\x00\x00\x00\x1f\x00\x08\x00\x7f\x00\x00\x00'
+    b'\x5f\x00\x00\x00\x9f\x00\x00\x00\x5f\x00\x3f\x00\xbf\x00\x00\x00'
+    b'\x33\x00\xcc\x00\x00\x00\x66\x00\xff\x00\x7f\x00\x08\x00\xb2\x00'
+    b'\x19\x00\xe5\x00\x00\x00\x4c\x00\xcc\x00\x99\x00\x33\x00\x19\x00'
+    b'\xff\x00\xe2\x00\xff\x00\xff\x00\xc6\x00\x1c\x00\x8d\x00\x38\x00'
+    b'\xaa\x00\x38\x00\x55\x00\x1c\x00\xaa\x00\x1c\x00\x71\x00\x38\x00'
+    # (2, 0): node_18
+    b'\xff\x00\x08\x00\x1c\x00\x1c\x00\xc6\x00\x38\x00\x38\x00\x55\x00'
+    b'\xff\x00\x55\x00\x71\x00\x71\x00\xe2\x00\x8d\x00\xaa\x00\x8d\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x00\x00\x7f\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x3f\x00\x00\x00\xbf\x00\x00\x00'
+    b'\xff\x00\x00\x00\xff\x00\x7f\x00\x00\x00\x55\x00\x00\x00\xd4\x00'
+    b'\x00\x00\xd4\x00\x2a\x00\xaa\x00\x00\x00\x7f\x00\x00\x00\x00\x00'
+    # (2, 1): node_14
+    b'\xff\x00\x00\x00\x33\x00\x00\x00\x00\x00\x00\x00\x66\x00\x00\x00'
+    b'\xcc\x00\x00\x00\x99\x00\x00\x00\x00\x00\x00\x00\x33\x00\x00\x00'
+    b'\x00\x00\x00\x00\x08\x00\x24\x00\xff\x00\x00\x00\xb6\x00\x08\x00'
+    b'\x00\x00\x00\x00\x48\x00\x6d\x00\x91\x00\x00\x00\xff\x00\xda\x00'
+    b'\xd4\x00\x08\x00\xaa\x00\x00\x00\x7f\x00\x00\x00\x55\x00\x08\x00'
+    b'\xff\x00\x08\x00\xaa\x00\x00\x00\x7f\x00\x00\x00\x2a\x00\x08\x00'
+    # (2, 2): node_4
+    b'\xff\x00\x1f\x00\x3f\x00\x3f\x00\x7f\x00\x5f\x00\xbf\x00\x3f\x00'
+    b'\xdf\x00\x1f\x00\x9f\x00\x3f\x00\x1f\x00\x3f\x00\x5f\x00\x1f\x00'
+    b'\x08\x00\x00\x00\x5f\x00\x3f\x00\xff\x00\x00\x00\x7f\x00\x00\x00'
+    b'\x08\x00\x00\x00\x9f\x00\x3f\x00\xff\x00\xdf\x00\xbf\x00\x1f\x00'
+    b'\x4c\x00\x19\x00\xff\x00\x7f\x00\x99\x00\x33\x00\xcc\x00\x66\x00'
+    b'\x4c\x00\x33\x00\xe5\x00\x7f\x00\x99\x00\x33\x00\xb2\x00\x66\x00'
+    # (2, 3): node_5
+    b'\xff\x00\x33\x00\x19\x00\x4c\x00\x00\x00\x00\x00\x66\x00\x00\x00'
+    b'\xcc\x00\xe5\x00\x00\x00\xb2\x00\x00\x00\x99\x00\x7f\x00\x08\x00'
+    b'\xb2\x00\x7f\x00\x99\x00\xcc\x00\xff\x00\x00\x00\x19\x00\x4c\x00'
+    b'\x66\x00\x33\x00\x00\x00\x00\x00\xe5\x00\x19\x00\x19\x00\xcc\x00'
+    b'\xb2\x00\x66\x00\xff\x00\x4c\x00\x7f\x00\x4c\x00\xe5\x00\x4c\x00'
+    b'\x99\x00\x66\x00\xff\x00\x19\x00\x7f\x00\x33\x00\xcc\x00\x33\x00'
+    # (2, 4): node_3
+    b'\xff\x00\xd4\x00\x3f\x00\x00\x00\x6a\x00\x94\x00\x55\x00\x7f\x00'
+    b'\xbf\x00\x15\x00\xe9\x00\x00\x00\x15\x00\xaa\x00\x00\x00\x2a\x00'
+    b'\x00\x00\x00\x00\x8d\x00\x71\x00\xff\x00\xc6\x00\x00\x00\x38\x00'
+    b'\x00\x00\x55\x00\x38\x00\x1c\x00\xe2\x00\x1c\x00\xaa\x00\x38\x00'
+    b'\xff\x00\xe7\x00\xff\x00\xd0\x00\x8b\x00\x5c\x00\x73\x00\x5c\x00'
+    b'\xb9\x00\x45\x00\x2e\x00\x2e\x00\xa2\x00\x17\x00\xd0\x00\x2e\x00'
+    # (3, 0): node_23
+    b'\xff\x00\x00\x00\xe5\x00\x00\x00\xcc\x00\xcc\x00\x00\x00\x4c\x00'
+    b'\xb2\x00\x99\x00\x33\x00\xb2\x00\xb2\x00\x7f\x00\x66\x33\x33\x19'
+    b'\x00\x00\x00\x00\x00\x00\x00\x1f\x00\x00\x00\x00\xff\x00\x00\x1f'
+    b'\x00\x00\x08\x00\x00\x00\xbf\x9f\x7f\x5f\x5f\x00\xdf\x00\x3f\x00'
+    b'\xff\x00\xff\x00\xcc\xcc\xcc\xcc\x00\x00\x33\x33\x33\x33\x00\x00'
+    b'\xcc\x00\xcc\x00\x99\x99\x99\x99\x99\x00\x00\x00\x66\x66\x66\x66'
+    # (3, 1): node_16
+    b'\xff\x00\x00\x00\x00\x00\x5f\x00\x00\x00\x7f\x00\x00\x00\x00\x00'
+    b'\xdf\x00\x5f\x00\x3f\x00\x1f\x00\xbf\x00\x00\x00\x9f\x00\x00\x00'
+    b'\x00\x00\x1f\x00\xff\x00\x00\x00\x00\x00\x5f\x00\xdf\x00\x00\x00'
+    b'\x00\x00\x3f\x00\xbf\x00\x00\x00\x00\x00\x00\x00\x9f\x00\x7f\x00'
+    b'\x8d\x00\x1c\x00\x1c\x00\x1c\x00\x71\x00\x08\x00\x08\x00\x08\x00'
+    b'\xff\x00\x00\x00\xe2\x00\x00\x00\xc6\x00\x38\x00\xaa\x00\x55\x00'
+    # (3, 2): node_21
+    b'\xff\x00\x00\x00\xda\x00\x00\x00\x91\x00\x00\x00\x24\x00\x00\x00'
+    b'\xda\x00\x00\x00\x24\x00\x00\x00\xb6\x00\x48\x00\x00\x00\x6d\x00'
+    b'\x00\x00\x00\x00\x08\x00\x00\x00\xff\x00\x55\x00\xd4\x00\x2a\x00'
+    b'\x00\x00\x00\x00\x08\x00\x00\x00\x55\x00\xaa\x00\x7f\x00\x2a\x00'
+    b'\x6d\x00\x6d\x00\xff\x00\x00\x00\x48\x00\x48\x00\xda\x00\x00\x00'
+    b'\x91\x00\xb6\x00\xff\x00\x00\x00\x24\x00\x24\x00\xda\x00\x08\x00'
+    # (3, 3): node_1
+    b'\xe5\x00\x19\x00\x66\x00\x19\x00\xcc\x00\x19\x00\x4c\x00\x08\x00'
+    b'\xff\x00\x08\x00\x33\x00\x19\x00\xb2\x00\x19\x00\x99\x00\x7f\x00'
+    b'\x1c\x00\xc6\x00\x38\x00\x38\x00\xe2\x00\x1c\x00\x8d\x00\x1c\x00'
+    b'\x1c\x00\xaa\x00\x1c\x00\x1c\x00\xff\x00\x71\x00\x55\x00\x55\x00'
+    b'\x9f\x00\x9f\x00\xff\x00\x3f\x00\x9f\x00\x9f\x00\xbf\x00\x1f\x00'
+    b'\x9f\x00\x7f\x00\xff\x00\x1f\x00\x9f\x00\x7f\x00\xdf\x00\x5f\x00'
+    # (3, 4): node_2
+    b'\xff\x00\x00\x00\x7f\x00\x00\x00\x00\x00\x66\x00\x00\x00\xe5\x00'
+    b'\x00\x00\xb2\x00\xcc\x00\x00\x00\x4c\x00\x33\x00\x99\x00\x19\x00'
+    b'\x00\x00\x7f\x00\x00\x00\x00\x00\xff\x00\xbf\x00\x1f\x00\x3f\x00'
+    b'\x00\x00\x5f\x00\x00\x00\x00\x00\xdf\x00\x00\x00\x1f\x00\x9f\x00'
+    b'\xff\x00\x55\x00\x94\x00\x55\x00\x7f\x00\x55\x00\x6a\x00\x3f\x00'
+    b'\xd4\x00\xaa\x00\xbf\x00\xaa\x00\x55\x00\x2a\x00\xe9\x00\x15\x00'
+    # (4, 0): node_24
+    b'\xaa\x00\x00\x00\x00\xff\x00\x00\xc6\x00\x00\x00\x00\x1c\x00\x00'
+    b'\x8d\x00\x00\x00\x00\xe2\x00\x00\x38\x00\x00\x71\x00\x55\x00\x00'
+    b'\xff\x00\x00\x00\x00\x71\x00\x00\x55\x00\x00\x00\x00\xe2\x00\x00'
+    b'\x8d\x00\x00\x08\x00\xaa\x38\x38\xc6\x00\x00\x38\x00\x8d\x1c\x00'
+    b'\xff\x00\x00\x00\x00\xbf\x00\x00\x9f\x00\x00\x00\x00\xdf\x00\x00'
+    b'\x5f\x00\x00\x00\x00\x3f\x00\x00\x7f\x00\x00\x00\x00\x1f\x00\x00'
+    # (4, 1): node_19
+    b'\xff\x00\x00\x00\x00\x00\xda\x00\xb6\x00\x00\x00\x00\x00\x91\x00'
+    b'\x91\x00\x24\x00\x00\x00\x6d\x00\x6d\x00\x00\x00\x48\x00\x24\x00'
+    b'\x00\x00\x00\x00\x6d\x00\x08\x00\x48\x00\x00\x00\xff\x00\xb6\x00'
+    b'\x00\x00\x00\x00\x91\x00\x08\x00\x24\x00\x08\x00\xda\x00\xb6\x00'
+    b'\xff\x00\x00\x00\x00\x00\xe2\x00\x55\x00\x00\x00\x8d\x00\x00\x00'
+    b'\x00\x00\x00\x00\xaa\x00\x38\x00\xc6\x00\x00\x00\x71\x00\x1c\x00'
+    # (4, 2): node_17
+    b'\xff\x00\x00\x00\x08\x00\x00\x00\xb6\x00\x00\x00\x48\x00\x00\x00'
+    b'\xda\x00\x00\x00\x24\x00\x00\x00\x91\x00\x00\x00\x6d\x00\x00\x00'
+    b'\x00\x00\x33\x19\x4c\x19\x19\x00\x99\x00\x00\x00\x7f\x66\xb2\x00'
+    b'\xcc\x00\x00\x00\x00\x00\xff\x00\x00\x00\x66\x00\xe5\x00\x4c\x00'
+    b'\x71\x00\x00\x00\x8d\x00\x55\x00\x00\x00\x00\x00\xaa\x00\x00\x00'
+    b'\x38\x1c\xff\x00\x00\x00\x00\x00\xc6\x00\x00\x00\xe2\x00\x00\x00'
+    # (4, 3): node_20
+    b'\xff\x00\x00\x00\x71\x00\x00\x00\xc6\x00\x38\x00\x55\x00\x1c\x00'
+    b'\xff\x00\x00\x00\xe2\x00\x00\x00\xaa\x00\x00\x00\x8d\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\x91\x00\x6d\x00\xda\x00'
+    b'\x24\x00\xb6\x00\x48\x00\x48\x00\xff\x00\x00\x00\x00\x00\x6d\x00'
+    b'\x24\x00\x24\x00\x91\x00\x00\x00\x48\x00\x48\x00\xb6\x00\x00\x00'
+    b'\x48\x00\x48\x00\xda\x00\x00\x00\x6d\x00\x6d\x00\xff\x00\x00\x00'
+    # (4, 4): node_22
+    b'\xff\x00\x00\x00\x2a\x00\x00\x00\xd4\x00\x00\x00\x08\x00\xd4\x00'
+    b'\xaa\x00\x00\x00\x55\x00\x00\x00\xd4\x00\x08\x00\x7f\x00\x08\x00'
+    b'\xff\x00\x55\x00\x00\x00\x00\x00\xe2\x00\x55\x00\x00\x00\xc6\x00'
+    b'\x00\x00\x8d\x00\x38\x00\x00\x00\xaa\x00\x1c\x00\x00\x00\x71\x00'
+    b'\x71\x00\x38\x00\xff\x00\x00\x00\x55\x00\x38\x00\xe2\x00\x00\x00'
+    b'\x00\x00\xaa\x00\x00\x00\x8d\x00\x1c\x00\x1c\x00\xc6\x00\x1c\x00'
+)
+
+# The 5x5 grid of nodes, as views into drum_map_nodes
+_nodes = memoryview(drum_map_nodes)
 drum_map = [
-    [node_10, node_8, node_0, node_9, node_11],
-    [node_15, node_7, node_13, node_12, node_6],
-    [node_18, node_14, node_4, node_5, node_3],
-    [node_23, node_16, node_21, node_1, node_2],
-    [node_24, node_19, node_17, node_20, node_22]
-]
\ No newline at end of file
+    [_nodes[((i * 5) + j) * 96 : ((i * 5) + j + 1) * 96] for j in range(5)]
+    for i in range(5)
+]
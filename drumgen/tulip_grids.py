@@ -24,6 +24,8 @@ grids.set_pitch(2, 0.6)
 grids.set_pan(0, 0.3)
 """
 
+_GM_DRUM_NOTES = (36, 38, 42)  # Bass drum, Snare drum, Closed hi-hat
+
 
 class TulipGrids:
     def __init__(self, use_internal_drums=True):
@@ -38,16 +40,34 @@ class TulipGrids:
             self.synth = midi.Synth(3)  # 3-voice polyphony for drums
             self.synth.program_change(128)  # Set to GM drums
 
-        self.drum_presets = [1, 2, 0]  # Default presets for BD, SD, HH
+        self.drum_presets = bytearray([1, 2, 0])  # Default presets for BD, SD, HH
+        self._base_notes = bytearray([drumkit[p][0] for p in self.drum_presets])
         self.velocities = array.array("f", [0.5, 0.5, 0.5])
         self.pitches = array.array("f", [0.5, 0.5, 0.5])
         self.pans = array.array("f", [0.5, 0.5, 0.5])
 
+        # Note and velocity arguments for each channel's note_on, kept up to
+        # date by set_preset, set_velocity and set_pitch
+        self._notes = array.array("i", [0, 0, 0])
+        self._note_velocities = [0, 0, 0]
+        for i in range(3):
+            self._update_note(i)
+
+        # Resolved once here, rather than on every tick
+        self._note_on = self.synth.note_on
+        if use_internal_drums:
+            self._trigger = self._trigger_internal
+        else:
+            self._trigger = self._trigger_gm
+        self._sequencer_callback = self._make_sequencer_callback()
+
     def __del__(self):
         self.stop()
 
     def start(self):
         if self.seq_slot is None:
+            # Don't make the first tick pay for building the pattern
+            self.pattern_generator.refresh()
             self.seq_slot = seq_add_callback(
                 self._sequencer_callback, 2
             )  # Call every 2 ticks (24 PPQN equivalent)
@@ -59,35 +79,54 @@ class TulipGrids:
 
     def set_mode_grids(self):
         self.mode = "grids"
-        self.pattern_generator.output_mode = "grids"
+        self.pattern_generator.set_output_mode("grids")
 
     def set_mode_euclidean(self):
         self.mode = "euclidean"
-        self.pattern_generator.output_mode = "euclidean"
+        self.pattern_generator.set_output_mode("euclidean")
 
-    def _sequencer_callback(self, time):
-        if self.mode == "grids":
-            state = self.pattern_generator.evaluate()
-        else:  # Euclidean mode
-            state = self.pattern_generator.evaluate_euclidean()
+    def _update_note(self, channel):
+        if self.use_internal_drums:
+            pitch_offset = (self.pitches[channel] - 0.5) * 24.0
+            self._notes[channel] = int(self._base_notes[channel] + pitch_offset)
+            self._note_velocities[channel] = self.velocities[channel] * 2
+        else:
+            self._notes[channel] = _GM_DRUM_NOTES[channel]
+            self._note_velocities[channel] = int(self.velocities[channel] * 127)
+
+    def _trigger_internal(self, channel, time):
+        self._note_on(
+            self._notes[channel],
+            self._note_velocities[channel],
+            pcm_patch=self.drum_presets[channel],
+            pan=self.pans[channel],
+            time=time,
+        )
 
-        for i in range(3):
-            if state & (1 << i):
-                if self.use_internal_drums:
-                    base_note = drumkit[self.drum_presets[i]][0]
-                    note_for_pitch = int(base_note + (self.pitches[i] - 0.5) * 24.0)
-                    self.synth.note_on(
-                        note_for_pitch,
-                        self.velocities[i] * 2,
-                        pcm_patch=self.drum_presets[i],
-                        pan=self.pans[i],
-                        time=time,
-                    )
-                else:
-                    note = [36, 38, 42][i]  # Bass drum, Snare drum, Closed hi-hat
-                    self.synth.note_on(note, int(self.velocities[i] * 127), time=time)
-
-        self.pattern_generator.tick_clock()
+    def _trigger_gm(self, channel, time):
+        self._note_on(self._notes[channel], self._note_velocities[channel], time=time)
+
+    def _make_sequencer_callback(self):
+        # Everything the callback needs is bound into the closure, so a tick
+        # does no attribute lookups on self. The mode is still followed, as
+        # evaluate() dispatches through the pattern generator's bound method
+        evaluate = self.pattern_generator.evaluate
+        tick_clock = self.pattern_generator.tick_clock
+        trigger = self._trigger
+
+        def sequencer_callback(time):
+            state = evaluate()
+            if state & 0x07:
+                if state & 1:
+                    trigger(0, time)
+                if state & 2:
+                    trigger(1, time)
+                if state & 4:
+                    trigger(2, time)
+
+            tick_clock()
+
+        return sequencer_callback
 
     def set_x(self, value):
         self.pattern_generator.x = value
@@ -96,7 +135,7 @@ class TulipGrids:
         self.pattern_generator.y = value
 
     def set_density(self, channel, value):
-        self.pattern_generator.density[channel] = value
+        self.pattern_generator.set_density(channel, value)
 
     def set_chaos(self, value):
         self.pattern_generator.randomness = value
@@ -104,14 +143,18 @@ class TulipGrids:
     def set_preset(self, channel, preset):
         if 0 <= channel < 3 and 0 <= preset < len(drumkit):
             self.drum_presets[channel] = preset
+            self._base_notes[channel] = drumkit[preset][0]
+            self._update_note(channel)
 
     def set_velocity(self, channel, velocity):
         if 0 <= channel < 3 and 0 <= velocity <= 1:
             self.velocities[channel] = velocity
+            self._update_note(channel)
 
     def set_pitch(self, channel, pitch):
         if 0 <= channel < 3 and 0 <= pitch <= 1:
             self.pitches[channel] = pitch
+            self._update_note(channel)
 
     def set_pan(self, channel, pan):
         if 0 <= channel < 3 and 0 <= pan <= 1:
@@ -190,7 +233,7 @@ class GridsGUI(UIElement):
         self.mode_label.align_to(self.mode_switch, lv.ALIGN.OUT_LEFT_MID, -10, 0)
 
         # Set initial state
-        if self.grids.pattern_generator.output_mode == "euclidean":
+        if self.grids.mode == "euclidean":
             self.mode_switch.add_state(lv.STATE.CHECKED)
             self.mode_label.set_text("Euclidean")
 
@@ -230,10 +273,10 @@ class GridsGUI(UIElement):
     def _mode_cb(self, e):
         if self.mode_switch.get_state() == lv.STATE.CHECKED:
             self.mode_label.set_text("Euclidean")
-            self.grids.pattern_generator.output_mode = "euclidean"
+            self.grids.set_mode_euclidean()
         else:
             self.mode_label.set_text("Grids")
-            self.grids.pattern_generator.output_mode = "grids"
+            self.grids.set_mode_grids()
 
 
 def run(screen):
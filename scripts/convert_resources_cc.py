@@ -15,26 +15,27 @@ def convert_cpp_arrays_to_python(cpp_file_path, python_file_path):
     # Regular expression to match C++ array declarations
     pattern = r"const\s+prog_uint8_t\s+(\w+)\[\]\s+PROGMEM\s*=\s*\{([^}]+)\};"
 
+    parts = ["from array import array\n\n"]
+
+    for match in re.finditer(pattern, content):
+        array_name = match.group(1)
+        array_values = match.group(2)
+
+        # Convert values to a list of integers
+        values = list(map(int, filter(str.strip, array_values.split(","))))
+
+        # Create the Python array string with 32 values per line
+        parts.append(f"{array_name} = array('B', [\n")
+        lines = [
+            "    " + ", ".join(map(str, values[i : i + 32]))
+            for i in range(0, len(values), 32)
+        ]
+        if lines:
+            parts.append(",\n".join(lines) + "\n")
+        parts.append("])\n\n")
+
     with open(python_file_path, "w") as python_file:
-        python_file.write("from array import array\n\n")
-
-        for match in re.finditer(pattern, content):
-            array_name = match.group(1)
-            array_values = match.group(2)
-
-            # Convert values to a list of integers
-            values = [int(x.strip()) for x in array_values.split(",") if x.strip()]
-
-            # Create the Python array string with 32 values per line
-            python_file.write(f"{array_name} = array('B', [\n")
-            for i in range(0, len(values), 32):
-                line = "    " + ", ".join(map(str, values[i : i + 32]))
-                python_file.write(line)
-                if i + 32 < len(values):
-                    python_file.write(",\n")
-                else:
-                    python_file.write("\n")
-            python_file.write("])\n\n")
+        python_file.write("".join(parts))
 
 
 if __name__ == "__main__":
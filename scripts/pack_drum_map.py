@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+# Packs the drum map nodes from the C source code arrays into a single bytes
+# literal, in the order of the 5x5 grid, and writes drumgen/resources_drum_map.py
+
+# !wget https://raw.githubusercontent.com/pichenettes/eurorack/master/grids/resources.cc
+# ./pack_drum_map.py
+
+import re
+
+# Node names for the 5x5 grid, as in the pattern generator's drum_map
+GRID = [
+    ["node_10", "node_8", "node_0", "node_9", "node_11"],
+    ["node_15", "node_7", "node_13", "node_12", "node_6"],
+    ["node_18", "node_14", "node_4", "node_5", "node_3"],
+    ["node_23", "node_16", "node_21", "node_1", "node_2"],
+    ["node_24", "node_19", "node_17", "node_20", "node_22"],
+]
+
+NODE_SIZE = 96
+BYTES_PER_LINE = 16
+
+
+def read_nodes(cpp_file_path):
+    with open(cpp_file_path, "r") as cpp_file:
+        content = cpp_file.read()
+
+    pattern = r"const\s+prog_uint8_t\s+(node_\d+)\[\]\s+PROGMEM\s*=\s*\{([^}]+)\};"
+
+    nodes = {}
+    for match in re.finditer(pattern, content):
+        values = match.group(2).split(",")
+        nodes[match.group(1)] = list(map(int, filter(str.strip, values)))
+    return nodes
+
+
+def write_drum_map_module(nodes, python_file_path):
+    parts = [
+        "# fmt: off\n",
+        "# Generated by scripts/pack_drum_map.py, don't edit by hand\n\n",
+        "# The 25 nodes of the 5x5 grid, 96 bytes each, node (i, j) starting at\n",
+        "# ((i * 5) + j) * 96. Within a node:\n",
+        "# 0 -  31: BD\n",
+        "# 32 - 63: SD\n",
+        "# 64 - 96: HH\n",
+        "drum_map_nodes = (\n",
+    ]
+
+    for i, row in enumerate(GRID):
+        for j, name in enumerate(row):
+            values = nodes[name]
+            if len(values) != NODE_SIZE:
+                raise ValueError(f"{name} has {len(values)} values")
+
+            parts.append(f"    # ({i}, {j}): {name}\n")
+            for k in range(0, NODE_SIZE, BYTES_PER_LINE):
+                line = "".join(f"\\x{v:02x}" for v in values[k : k + BYTES_PER_LINE])
+                parts.append(f"    b'{line}'\n")
+
+    parts.append(")\n\n")
+    parts.append(
+        "# The 5x5 grid of nodes, as views into drum_map_nodes\n"
+        "_nodes = memoryview(drum_map_nodes)\n"
+        "drum_map = [\n"
+        "    [_nodes[((i * 5) + j) * 96 : ((i * 5) + j + 1) * 96] for j in range(5)]\n"
+        "    for i in range(5)\n"
+        "]\n"
+    )
+
+    with open(python_file_path, "w") as python_file:
+        python_file.write("".join(parts))
+
+
+if __name__ == "__main__":
+    cpp_file_path = "resources.cc"
+    python_file_path = "../drumgen/resources_drum_map.py"
+    write_drum_map_module(read_nodes(cpp_file_path), python_file_path)
@@ -0,0 +1,256 @@
+import random
+import unittest
+
+from drumgen.grids import PatternGenerator
+from drumgen.resources_drum_map import drum_map
+
+EDGES = (0, 1, 2, 3, 4, 63, 64, 127, 128, 191, 192, 252, 254, 255)
+
+
+def _u8_mix(a, b, balance):
+    return ((b * balance) + (a * (255 - balance))) >> 8
+
+
+def reference_level(x, y, step, instrument):
+    # The straight scalar read, blended in 16 steps across each cell
+    i, j = x >> 6, y >> 6
+    offset = (instrument * 32) + step
+
+    a = drum_map[i][j][offset]
+    b = drum_map[min(i + 1, 4)][j][offset]
+    c = drum_map[i][min(j + 1, 4)][offset]
+    d = drum_map[min(i + 1, 4)][min(j + 1, 4)][offset]
+
+    x_balance = ((x >> 2) & 0x0F) * 17
+    y_balance = ((y >> 2) & 0x0F) * 17
+
+    return _u8_mix(_u8_mix(a, b, x_balance), _u8_mix(c, d, x_balance), y_balance)
+
+
+def reference_state(x, y, density, perturbation, step):
+    state = 0
+    accent_bits = 0
+    for i in range(3):
+        level = reference_level(x, y, step, i)
+        if level < 255 - perturbation[i]:
+            level += perturbation[i]
+        else:
+            level = 255
+
+        if level > 255 - density[i]:
+            state |= 1 << i
+            if level > 192:
+                accent_bits |= 1 << i
+
+    state |= accent_bits << 3
+    state |= 1 << 6
+    if step == 0:
+        state |= 1 << 7
+    return state
+
+
+class ReadDrumMapTest(unittest.TestCase):
+    def check(self, x, y):
+        pg = PatternGenerator()
+        pg.x = x
+        pg.y = y
+        for instrument in range(3):
+            for step in range(32):
+                self.assertEqual(
+                    pg.read_drum_map(step, instrument),
+                    reference_level(x, y, step, instrument),
+                    (x, y, step, instrument),
+                )
+
+    def test_edges(self):
+        for x in EDGES:
+            for y in EDGES:
+                self.check(x, y)
+
+    def test_random(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            self.check(rng.randint(0, 255), rng.randint(0, 255))
+
+    def test_moves(self):
+        # Moving x and y on an existing generator, including moves within
+        # one quantization step
+        pg = PatternGenerator()
+        rng = random.Random(2)
+        for _ in range(300):
+            x = rng.choice((pg.x + 1, pg.x - 1, rng.choice(EDGES)))
+            y = rng.choice((pg.y + 1, pg.y - 1, rng.choice(EDGES)))
+            pg.x = min(max(x, 0), 255)
+            pg.y = min(max(y, 0), 255)
+            step, instrument = rng.randrange(32), rng.randrange(3)
+            self.assertEqual(
+                pg.read_drum_map(step, instrument),
+                reference_level(pg.x, pg.y, step, instrument),
+            )
+
+    def test_out_of_range(self):
+        # Out of range x and y are clamped to the map, and the drum map is
+        # read with unchecked pointers, so nothing may index past it
+        for x, y, clamped_x, clamped_y in (
+            (256, 128, 255, 128),
+            (319, 319, 255, 255),
+            (1000, 0, 255, 0),
+            (-1, 300, 0, 255),
+        ):
+            pg = PatternGenerator()
+            pg.x, pg.y = x, y
+            for step in range(32):
+                self.assertEqual(
+                    pg.read_drum_map(step, 0),
+                    reference_level(clamped_x, clamped_y, step, 0),
+                )
+            pg.evaluate()
+
+        pg = PatternGenerator()
+        for step, instrument in ((-1, 0), (32, 0), (0, -1), (0, 3)):
+            with self.assertRaises(IndexError):
+                pg.read_drum_map(step, instrument)
+
+
+class EvaluateTest(unittest.TestCase):
+    def run_bars(self, pg, bars=1):
+        self.run_pulses(pg, bars * 32 * pg.pulses_per_step)
+
+    def run_pulses(self, pg, pulses):
+        # Evaluate each pulse, checking the steps against the scalar model
+        # with the bar's perturbation
+        for _ in range(pulses):
+            out = pg.evaluate()
+            if pg.pulse == 0:
+                if pg.step == 0 and pg.randomness == 0:
+                    self.assertEqual(list(pg.part_perturbation), [0, 0, 0])
+                expected = reference_state(
+                    pg.x, pg.y, list(pg.density), list(pg.part_perturbation), pg.step
+                )
+                self.assertEqual(out, expected, (pg.x, pg.y, list(pg.density), pg.step))
+            else:
+                self.assertEqual(out, 0)
+            pg.tick_clock()
+
+    def test_edges(self):
+        for x in (0, 128, 255):
+            for y in (0, 128, 255):
+                for density in (0, 1, 128, 254, 255):
+                    for randomness in (0, 255):
+                        pg = PatternGenerator()
+                        pg.x, pg.y, pg.randomness = x, y, randomness
+                        pg.density = [density, 255 - density, density]
+                        self.run_bars(pg)
+
+    def test_random(self):
+        rng = random.Random(3)
+        for _ in range(30):
+            pg = PatternGenerator()
+            pg.x = rng.randint(0, 255)
+            pg.y = rng.randint(0, 255)
+            pg.randomness = rng.randint(0, 255)
+            pg.density = [rng.randint(0, 255) for _ in range(3)]
+            self.run_bars(pg, 2)
+
+    def test_parameter_changes(self):
+        # Changes land mid-bar and between bars, through every setter
+        rng = random.Random(4)
+        pg = PatternGenerator()
+        for _ in range(3000):
+            r = rng.random()
+            if r < 0.02:
+                pg.randomness = rng.choice((0, 0, 1, 255, rng.randint(0, 255)))
+            elif r < 0.04:
+                pg.x = rng.choice(EDGES + (rng.randint(0, 255),))
+            elif r < 0.06:
+                pg.y = rng.choice(EDGES + (rng.randint(0, 255),))
+            elif r < 0.08:
+                channel = rng.randrange(3)
+                value = rng.choice((0, 255, rng.randint(0, 255)))
+                if rng.random() < 0.5:
+                    pg.set_density(channel, value)
+                else:
+                    pg.density[channel] = value
+            elif r < 0.09:
+                pg.density = [rng.choice((0, rng.randint(0, 255))) for _ in range(3)]
+            self.run_pulses(pg, 1)
+
+    def test_density_reenabled(self):
+        # A channel at density 0 isn't blended, so turning it back up after
+        # x and y have moved must bring back the levels at the new position
+        pg = PatternGenerator()
+        pg.density = [0, 0, 0]
+        self.run_bars(pg)
+        pg.x, pg.y = 10, 250
+        self.run_bars(pg)
+        for channel, value in enumerate((255, 128, 64)):
+            pg.density[channel] = value
+            self.run_bars(pg)
+        pg.set_density(1, 0)
+        pg.x = 200
+        self.run_bars(pg)
+        pg.set_density(1, 255)
+        self.run_bars(pg)
+
+    def test_randomness_to_zero_mid_bar(self):
+        # The bar keeps its perturbation until the next one is rolled
+        pg = PatternGenerator()
+        pg.randomness = 255
+        pg.density = [128, 128, 128]
+        for _ in range(16 * pg.pulses_per_step):
+            pg.evaluate()
+            pg.tick_clock()
+        perturbation = list(pg.part_perturbation)
+        pg.randomness = 0
+        while pg.step != 0:
+            out = pg.evaluate()
+            if pg.pulse == 0:
+                self.assertEqual(
+                    out, reference_state(pg.x, pg.y, pg.density, perturbation, pg.step)
+                )
+            pg.tick_clock()
+        self.run_bars(pg)
+        self.assertEqual(list(pg.part_perturbation), [0, 0, 0])
+
+    def test_seed(self):
+        def bars(pg):
+            pg.randomness = 255
+            perturbations = []
+            for _ in range(4 * 32 * pg.pulses_per_step):
+                pg.evaluate()
+                if pg.step == 0 and pg.pulse == 0:
+                    perturbations.append(list(pg.part_perturbation))
+                pg.tick_clock()
+            return perturbations
+
+        seeded = bars(PatternGenerator(seed=42))
+        self.assertEqual(bars(PatternGenerator(seed=42)), seeded)
+        self.assertNotEqual(bars(PatternGenerator(seed=43)), seeded)
+
+        pg = PatternGenerator()
+        pg.seed(42)
+        self.assertEqual(bars(pg), seeded)
+
+        # A zero seed would stick xorshift32 at zero
+        self.assertNotEqual(bars(PatternGenerator(seed=0))[1:], [[0, 0, 0]] * 3)
+
+
+class DensityTest(unittest.TestCase):
+    def test_item_writes(self):
+        pg = PatternGenerator()
+        pg.density[0] = 64
+        pg.density[2] = 192
+        self.assertEqual(list(pg.density), [64, 128, 192])
+        self.assertEqual(pg.density[0], 64)
+        self.assertEqual(len(pg.density), 3)
+
+    def test_wrong_length(self):
+        pg = PatternGenerator()
+        for value in ([], [1, 2], [1, 2, 3, 4]):
+            with self.assertRaises(ValueError):
+                pg.density = value
+        self.assertEqual(list(pg.density), [128, 128, 128])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from drumgen import resources_euclidean
+from drumgen.resources_euclidean import get_euclidean_pattern
+
+
+class EuclideanTest(unittest.TestCase):
+    def test_full_table(self):
+        # euclidean_patterns is still there, as the full 32 x 8 table
+        patterns = resources_euclidean.euclidean_patterns
+        self.assertEqual(len(patterns), 256)
+        self.assertIs(patterns, resources_euclidean.euclidean_patterns)
+        for steps in range(1, 33):
+            for slot in range(8):
+                self.assertEqual(
+                    get_euclidean_pattern(steps, slot * 4),
+                    patterns[((steps - 1) * 8) + slot],
+                )
+
+    def test_all_pulses(self):
+        for steps in range(1, 33):
+            for pulses in range(33):
+                pattern = get_euclidean_pattern(steps, pulses)
+                if pulses == 32:
+                    # One past the end of the row, which is always empty
+                    self.assertEqual(pattern, 0)
+                else:
+                    self.assertEqual(pattern, get_euclidean_pattern(steps, pulses & ~3))
+
+    def test_invalid(self):
+        for steps, pulses in ((0, 0), (33, 0), (1, -1), (1, 33)):
+            with self.assertRaises(ValueError):
+                get_euclidean_pattern(steps, pulses)
+
+
+if __name__ == "__main__":
+    unittest.main()